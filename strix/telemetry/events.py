@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, kw_only=True)
+class TraceEvent:
+    """A single events.jsonl record; ts and seq are stamped by the tracer on write."""
+
+    ts: str = ""
+    seq: int = 0
+    type: str = "event"
+
+
+@dataclass(slots=True, kw_only=True)
+class ScanStartEvent(TraceEvent):
+    type: str = "scan_start"
+    run_id: str
+    run_name: str | None
+    targets: list[Any]
+    meta: dict[str, Any]
+
+
+@dataclass(slots=True, kw_only=True)
+class AgentStepEvent(TraceEvent):
+    type: str = "agent_step"
+    agent_id: str
+    action: str
+    status: str
+    meta: dict[str, Any]
+
+
+@dataclass(slots=True, kw_only=True)
+class ToolCallEvent(TraceEvent):
+    type: str = "mcp_tool_call"
+    agent_id: str | None
+    tool: str | None
+    target: str | None
+    status: str
+    args: Any
+    result_summary: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class VulnFoundEvent(TraceEvent):
+    type: str = "vuln_found"
+    agent_id: str | None
+    target: str | None
+    vuln_id: str
+    severity: str
+    category: str | None
+    description: str
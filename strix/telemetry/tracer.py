@@ -1,10 +1,35 @@
+import atexit
+import csv
 import json
 import logging
+import queue
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import asdict, is_dataclass
 from datetime import UTC, datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import uuid4
 
+from strix.telemetry.events import (
+    AgentStepEvent,
+    ScanStartEvent,
+    ToolCallEvent,
+    TraceEvent,
+    VulnFoundEvent,
+)
+
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -12,6 +37,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_EVENT_BUFFER_MAX = 64
+_EVENT_FLUSH_INTERVAL = 0.25
+
+_WRITER_STOP = object()
+
+_NEWLINES_TO_SPACES = str.maketrans("\n", " ")
+
+_TS_CACHE_TTL = 0.001
+_ts_cache_tick = float("-inf")
+_ts_cache_value = ""
+
 _global_tracer: Optional["Tracer"] = None
 
 
@@ -24,11 +60,85 @@ def set_global_tracer(tracer: "Tracer") -> None:
     _global_tracer = tracer
 
 
+_INTERNAL_TOOL_NAMES = frozenset({"scan_start_info", "subagent_start_info"})
+
+_LLM_STAT_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cached_tokens",
+    "cache_creation_tokens",
+    "cost",
+    "requests",
+    "failed_requests",
+)
+_get_llm_stat_fields = attrgetter(*_LLM_STAT_FIELDS)
+
+_VULN_CATEGORIES = (
+    "sql injection",
+    "xss",
+    "csrf",
+    "idor",
+    "ssrf",
+    "xxe",
+    "rce",
+    "authentication",
+    "authorization",
+    "path traversal",
+    "file upload",
+    "mass assignment",
+    "business logic",
+    "race condition",
+)
+_CATEGORY_PRIORITY = {category: idx for idx, category in enumerate(_VULN_CATEGORIES)}
+# Lookahead so overlapping hits are all reported; the earliest category in the list wins.
+_CATEGORY_RE = re.compile(f"(?=({'|'.join(map(re.escape, _VULN_CATEGORIES))}))")
+
+_SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
+
+_VULN_CSV_FIELDS = ["id", "title", "severity", "timestamp", "file"]
+
+
+def _vuln_csv_row(report: dict[str, Any]) -> dict[str, str]:
+    return {
+        "id": report["id"],
+        "title": report["title"],
+        "severity": report["severity"].upper(),
+        "timestamp": report["timestamp"],
+        "file": f"vulnerabilities/{report['id']}.md",
+    }
+
+
+def _now_iso_cached() -> str:
+    """Return the current UTC time in ISO format, reusing it for bursts within 1ms."""
+    global _ts_cache_tick, _ts_cache_value  # noqa: PLW0603
+    tick = time.monotonic()
+    if tick - _ts_cache_tick >= _TS_CACHE_TTL:
+        _ts_cache_value = datetime.now(UTC).isoformat()
+        _ts_cache_tick = tick
+    return _ts_cache_value
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def _dumps_event(event: TraceEvent) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(event, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(event, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
 class Tracer:
     def __init__(self, run_name: str | None = None):
         self.run_name = run_name
         self.run_id = run_name or f"run-{uuid4().hex[:8]}"
-        self.start_time = datetime.now(UTC).isoformat()
+        self._start_dt = datetime.now(UTC)
+        self._end_dt: datetime | None = None
+        self.start_time = self._start_dt.isoformat()
         self.end_time: str | None = None
 
         self.agents: dict[str, dict[str, Any]] = {}
@@ -51,8 +161,29 @@ class Tracer:
         self._run_dir: Path | None = None
         self._next_execution_id = 1
         self._next_message_id = 1
-        self._saved_vuln_ids: set[str] = set()
+        self._next_event_seq = 1
+        self._next_vuln_id = 1
+        self._tools_by_agent: defaultdict[str, list[int]] = defaultdict(list)
+        self._real_tool_count = 0
+        self._saved_vuln_count = 0
+        self._vuln_csv_initialized = False
+        self._vuln_dir_created = False
+        # The final_scan_result last written to the report, compared by value so a result set
+        # while the writer thread is mid-write is still picked up by the next save.
+        self._written_report: str | None = None
         self._events_file: Any | None = None
+        self._event_buffer: list[bytes] = []
+        self._buffer_max = _EVENT_BUFFER_MAX
+        self._last_flush = time.monotonic()
+        # Reentrant: the CLI/TUI signal handlers call cleanup() on the main thread, which may
+        # already hold the lock inside _log_event.
+        self._events_lock = threading.RLock()
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._writer_q: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._writer_thread: threading.Thread | None = None
+        self._writer_stopped = False
+        self._save_lock = threading.Lock()
 
         self.vulnerability_found_callback: Callable[[str, str, str, str], None] | None = None
 
@@ -79,37 +210,73 @@ class Tracer:
             # Initialize events.jsonl file
             events_file_path = self._run_dir / "events.jsonl"
             try:
-                self._events_file = events_file_path.open("a", encoding="utf-8")
+                self._events_file = events_file_path.open("ab")
                 logger.info(f"Initialized events.jsonl at: {events_file_path}")
+                self._start_flush_thread()
             except (OSError, IOError) as e:
                 logger.error(f"Failed to open events.jsonl file at {events_file_path}: {e}")
                 self._events_file = None
 
         return self._run_dir
 
-    def _log_event(self, event_type: str, **kwargs: Any) -> None:
+    def _log_event(self, event: TraceEvent) -> None:
         """Log an event to events.jsonl file."""
         if self._events_file is None:
             self.get_run_dir()  # This will initialize _events_file
-        
+
         if self._events_file is None:
             logger.error("Failed to initialize events.jsonl file")
             return
 
-        event = {
-            "ts": datetime.now(UTC).isoformat(),
-            "type": event_type,
-            **kwargs,
-        }
+        with self._events_lock:
+            # ts is shared across bursts within 1ms, so seq keeps ordering unambiguous. Both are
+            # stamped under the lock that orders the buffer, so file order always follows seq.
+            event.ts = _now_iso_cached()
+            event.seq = self._next_event_seq
+            self._next_event_seq += 1
+            try:
+                line = _dumps_event(event) + b"\n"
+            except Exception as e:
+                logger.exception(f"Unexpected error serializing event: {e}")
+                return
+
+            self._event_buffer.append(line)
+            if (
+                len(self._event_buffer) >= self._buffer_max
+                or time.monotonic() - self._last_flush > _EVENT_FLUSH_INTERVAL
+            ):
+                self._flush_events_locked()
+        logger.debug(f"Logged event: {event.type}")
+
+    def _flush_events_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._event_buffer or self._events_file is None:
+            return
+        buffered = self._event_buffer
+        self._event_buffer = []
         try:
-            event_json = json.dumps(event, ensure_ascii=False)
-            self._events_file.write(event_json + "\n")
+            self._events_file.writelines(buffered)
             self._events_file.flush()
-            logger.debug(f"Logged event: {event_type}")
-        except (OSError, IOError, AttributeError) as e:
-            logger.warning(f"Failed to write event to events.jsonl: {e}")
-        except Exception as e:
-            logger.exception(f"Unexpected error writing event: {e}")
+        except (OSError, IOError, ValueError) as e:
+            logger.warning(f"Failed to write {len(buffered)} event(s) to events.jsonl: {e}")
+
+    def flush_events(self) -> None:
+        with self._events_lock:
+            self._flush_events_locked()
+
+    def _start_flush_thread(self) -> None:
+        if self._flush_thread is not None:
+            return
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="strix-events-flush", daemon=True
+        )
+        self._flush_thread.start()
+        atexit.register(self.flush_events)
+
+    def _flush_loop(self) -> None:
+        # Keeps events.jsonl tailers (strix_viz) close to realtime during quiet periods.
+        while not self._flush_stop.wait(_EVENT_FLUSH_INTERVAL):
+            self.flush_events()
 
     def add_vulnerability_report(
         self,
@@ -119,14 +286,17 @@ class Tracer:
         agent_id: str | None = None,
         target: str | None = None,
     ) -> str:
-        report_id = f"vuln-{len(self.vulnerability_reports) + 1:04d}"
+        report_id = f"vuln-{self._next_vuln_id:04d}"
+        self._next_vuln_id += 1
+        normalized_severity = severity.lower().strip()
 
         report = {
             "id": report_id,
             "title": title.strip(),
             "content": content.strip(),
-            "severity": severity.lower().strip(),
+            "severity": normalized_severity,
             "timestamp": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "_sev_key": _SEVERITY_ORDER.get(normalized_severity, len(_SEVERITY_ORDER)),
         }
 
         self.vulnerability_reports.append(report)
@@ -134,18 +304,19 @@ class Tracer:
 
         if self.vulnerability_found_callback:
             self.vulnerability_found_callback(
-                report_id, title.strip(), content.strip(), severity.lower().strip()
+                report_id, title.strip(), content.strip(), normalized_severity
             )
 
         # Log vuln_found event for visualization
         self._log_event(
-            event_type="vuln_found",
-            agent_id=agent_id,
-            target=target,
-            vuln_id=report_id,
-            severity=severity.lower().strip(),
-            category=self._extract_category_from_title(title),
-            description=content.strip()[:500],  # Truncate for event log
+            VulnFoundEvent(
+                agent_id=agent_id,
+                target=target,
+                vuln_id=report_id,
+                severity=normalized_severity,
+                category=self._extract_category_from_title(title),
+                description=content.strip()[:500],  # Truncate for event log
+            )
         )
 
         self.save_run_data()
@@ -153,27 +324,11 @@ class Tracer:
 
     def _extract_category_from_title(self, title: str) -> str | None:
         """Extract vulnerability category from title."""
-        title_lower = title.lower()
-        categories = [
-            "sql injection",
-            "xss",
-            "csrf",
-            "idor",
-            "ssrf",
-            "xxe",
-            "rce",
-            "authentication",
-            "authorization",
-            "path traversal",
-            "file upload",
-            "mass assignment",
-            "business logic",
-            "race condition",
-        ]
-        for category in categories:
-            if category in title_lower:
-                return category.replace(" ", "_")
-        return None
+        matches = _CATEGORY_RE.finditer(title.lower())
+        priority = min((_CATEGORY_PRIORITY[m.group(1)] for m in matches), default=None)
+        if priority is None:
+            return None
+        return _VULN_CATEGORIES[priority].replace(" ", "_")
 
     def set_final_scan_result(
         self,
@@ -194,14 +349,15 @@ class Tracer:
     def log_agent_creation(
         self, agent_id: str, name: str, task: str, parent_id: str | None = None
     ) -> None:
+        now = _now_iso_cached()
         agent_data: dict[str, Any] = {
             "id": agent_id,
             "name": name,
             "task": task,
             "status": "running",
             "parent_id": parent_id,
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "tool_executions": [],
         }
 
@@ -210,11 +366,12 @@ class Tracer:
         # Log agent_step event for visualization
         logger.info(f"About to log agent_step event for agent {agent_id}")
         self._log_event(
-            event_type="agent_step",
-            agent_id=agent_id,
-            action="created",
-            status="running",
-            meta={"name": name, "task": task, "parent_id": parent_id},
+            AgentStepEvent(
+                agent_id=agent_id,
+                action="created",
+                status="running",
+                meta={"name": name, "task": task, "parent_id": parent_id},
+            )
         )
         logger.info(f"Agent step event logged for agent {agent_id}")
 
@@ -233,7 +390,7 @@ class Tracer:
             "content": content,
             "role": role,
             "agent_id": agent_id,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": _now_iso_cached(),
             "metadata": metadata or {},
         }
 
@@ -244,7 +401,7 @@ class Tracer:
         execution_id = self._next_execution_id
         self._next_execution_id += 1
 
-        now = datetime.now(UTC).isoformat()
+        now = _now_iso_cached()
         execution_data = {
             "execution_id": execution_id,
             "agent_id": agent_id,
@@ -258,6 +415,9 @@ class Tracer:
         }
 
         self.tool_executions[execution_id] = execution_data
+        self._tools_by_agent[agent_id].append(execution_id)
+        if tool_name not in _INTERNAL_TOOL_NAMES:
+            self._real_tool_count += 1
 
         if agent_id in self.agents:
             self.agents[agent_id]["tool_executions"].append(execution_id)
@@ -269,12 +429,13 @@ class Tracer:
 
         # Log mcp_tool_call event for visualization
         self._log_event(
-            event_type="mcp_tool_call",
-            agent_id=agent_id,
-            tool=tool_name,
-            target=target,
-            status="running",
-            args=args,
+            ToolCallEvent(
+                agent_id=agent_id,
+                tool=tool_name,
+                target=target,
+                status="running",
+                args=args,
+            )
         )
 
         return execution_id
@@ -286,7 +447,7 @@ class Tracer:
             execution_data = self.tool_executions[execution_id]
             execution_data["status"] = status
             execution_data["result"] = result
-            execution_data["completed_at"] = datetime.now(UTC).isoformat()
+            execution_data["completed_at"] = _now_iso_cached()
 
             # Log tool completion event for visualization
             agent_id = execution_data.get("agent_id")
@@ -301,16 +462,17 @@ class Tracer:
             if isinstance(result, str):
                 result_summary = result[:200] + "..." if len(result) > 200 else result
             elif isinstance(result, dict):
-                result_summary = str(result).replace("\n", " ")[:200]
+                result_summary = str(result)[:200].translate(_NEWLINES_TO_SPACES)
 
             self._log_event(
-                event_type="mcp_tool_call",
-                agent_id=agent_id,
-                tool=tool_name,
-                target=target,
-                status=status,
-                args=args,
-                result_summary=result_summary,
+                ToolCallEvent(
+                    agent_id=agent_id,
+                    tool=tool_name,
+                    target=target,
+                    status=status,
+                    args=args,
+                    result_summary=result_summary,
+                )
             )
 
     def update_agent_status(
@@ -318,17 +480,18 @@ class Tracer:
     ) -> None:
         if agent_id in self.agents:
             self.agents[agent_id]["status"] = status
-            self.agents[agent_id]["updated_at"] = datetime.now(UTC).isoformat()
+            self.agents[agent_id]["updated_at"] = _now_iso_cached()
             if error_message:
                 self.agents[agent_id]["error_message"] = error_message
 
         # Log agent_step event for status changes
         self._log_event(
-            event_type="agent_step",
-            agent_id=agent_id,
-            action="status_update",
-            status=status,
-            meta={"error_message": error_message} if error_message else {},
+            AgentStepEvent(
+                agent_id=agent_id,
+                action="status_update",
+                status=status,
+                meta={"error_message": error_message} if error_message else {},
+            )
         )
 
     def set_scan_config(self, config: dict[str, Any]) -> None:
@@ -343,138 +506,168 @@ class Tracer:
         self.get_run_dir()
         # Log initial scan start event
         self._log_event(
-            event_type="scan_start",
-            run_id=self.run_id,
-            run_name=self.run_name,
-            targets=config.get("targets", []),
-            meta={"start_time": self.start_time},
+            ScanStartEvent(
+                run_id=self.run_id,
+                run_name=self.run_name,
+                targets=config.get("targets", []),
+                meta={"start_time": self.start_time},
+            )
         )
 
     def save_run_data(self, mark_complete: bool = False) -> None:
+        if mark_complete:
+            self._end_dt = datetime.now(UTC)
+            self.end_time = self._end_dt.isoformat()
+
+        if self._writer_stopped:
+            self._save_run_data_sync(mark_complete)
+            return
+
+        self._start_writer_thread()
+        self._writer_q.put(mark_complete)
+
+    def _start_writer_thread(self) -> None:
+        if self._writer_thread is not None:
+            return
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="strix-run-data-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        stop = False
+        while not stop:
+            requests = [self._writer_q.get()]
+            # Coalesce everything queued meanwhile into a single save.
+            with suppress(queue.Empty):
+                while True:
+                    requests.append(self._writer_q.get_nowait())
+            stop = any(request is _WRITER_STOP for request in requests)
+            saves = [request for request in requests if request is not _WRITER_STOP]
+            if saves:
+                try:
+                    self._save_run_data_sync(mark_complete=any(saves))
+                except Exception:
+                    # Keep the thread alive so later saves, including cleanup()'s, still run.
+                    logger.exception("Failed to save run data")
+
+    def _stop_writer_thread(self) -> None:
+        self._writer_stopped = True
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._writer_q.put(_WRITER_STOP)
+            self._writer_thread.join()
+
+    def _save_run_data_sync(self, mark_complete: bool = False) -> None:
+        with self._save_lock:
+            self._write_run_data(mark_complete)
+
+    def _write_run_data(self, mark_complete: bool) -> None:
         try:
             run_dir = self.get_run_dir()
-            if mark_complete:
-                self.end_time = datetime.now(UTC).isoformat()
 
-            if self.final_scan_result:
+            final_scan_result = self.final_scan_result
+            if final_scan_result and final_scan_result != self._written_report:
                 penetration_test_report_file = run_dir / "penetration_test_report.md"
                 with penetration_test_report_file.open("w", encoding="utf-8") as f:
                     f.write("# Security Penetration Test Report\n\n")
                     f.write(
                         f"**Generated:** {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
                     )
-                    f.write(f"{self.final_scan_result}\n")
+                    f.write(f"{final_scan_result}\n")
+                self._written_report = final_scan_result
                 logger.info(
                     f"Saved final penetration test report to: {penetration_test_report_file}"
                 )
 
             if self.vulnerability_reports:
-                vuln_dir = run_dir / "vulnerabilities"
-                vuln_dir.mkdir(exist_ok=True)
-
-                new_reports = [
-                    report
-                    for report in self.vulnerability_reports
-                    if report["id"] not in self._saved_vuln_ids
-                ]
-
-                for report in new_reports:
-                    vuln_file = vuln_dir / f"{report['id']}.md"
-                    with vuln_file.open("w", encoding="utf-8") as f:
-                        f.write(f"# {report['title']}\n\n")
-                        f.write(f"**ID:** {report['id']}\n")
-                        f.write(f"**Severity:** {report['severity'].upper()}\n")
-                        f.write(f"**Found:** {report['timestamp']}\n\n")
-                        f.write("## Description\n\n")
-                        f.write(f"{report['content']}\n")
-                    self._saved_vuln_ids.add(report["id"])
-
-                if self.vulnerability_reports:
-                    severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
-                    sorted_reports = sorted(
-                        self.vulnerability_reports,
-                        key=lambda x: (severity_order.get(x["severity"], 5), x["timestamp"]),
-                    )
-
-                    vuln_csv_file = run_dir / "vulnerabilities.csv"
-                    with vuln_csv_file.open("w", encoding="utf-8", newline="") as f:
-                        import csv
-
-                        fieldnames = ["id", "title", "severity", "timestamp", "file"]
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-
-                        for report in sorted_reports:
-                            writer.writerow(
-                                {
-                                    "id": report["id"],
-                                    "title": report["title"],
-                                    "severity": report["severity"].upper(),
-                                    "timestamp": report["timestamp"],
-                                    "file": f"vulnerabilities/{report['id']}.md",
-                                }
-                            )
-
-                if new_reports:
-                    logger.info(
-                        f"Saved {len(new_reports)} new vulnerability report(s) to: {vuln_dir}"
-                    )
-                logger.info(f"Updated vulnerability index: {vuln_csv_file}")
+                self._append_new_vuln_files(run_dir)
+                if mark_complete:
+                    self._finalize_vuln_index(run_dir)
 
             logger.info(f"📊 Essential scan data saved to: {run_dir}")
 
         except (OSError, RuntimeError):
             logger.exception("Failed to save scan data")
 
+    def _append_new_vuln_files(self, run_dir: Path) -> None:
+        vuln_dir = run_dir / "vulnerabilities"
+        if not self._vuln_dir_created:
+            vuln_dir.mkdir(exist_ok=True)
+            self._vuln_dir_created = True
+
+        # Reports are only ever appended, so everything past the saved count is new.
+        new_reports = self.vulnerability_reports[self._saved_vuln_count :]
+        if not new_reports:
+            return
+
+        for report in new_reports:
+            vuln_file = vuln_dir / f"{report['id']}.md"
+            body = (
+                f"# {report['title']}\n\n"
+                f"**ID:** {report['id']}\n"
+                f"**Severity:** {report['severity'].upper()}\n"
+                f"**Found:** {report['timestamp']}\n\n"
+                "## Description\n\n"
+                f"{report['content']}\n"
+            )
+            vuln_file.write_bytes(body.encode("utf-8"))
+            self._saved_vuln_count += 1
+
+        # Rows are appended in discovery order; _finalize_vuln_index() re-sorts at scan end.
+        vuln_csv_file = run_dir / "vulnerabilities.csv"
+        mode = "a" if self._vuln_csv_initialized else "w"
+        with vuln_csv_file.open(mode, encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_VULN_CSV_FIELDS)
+            if not self._vuln_csv_initialized:
+                writer.writeheader()
+            writer.writerows(_vuln_csv_row(report) for report in new_reports)
+        self._vuln_csv_initialized = True
+
+        logger.info(f"Saved {len(new_reports)} new vulnerability report(s) to: {vuln_dir}")
+
+    def _finalize_vuln_index(self, run_dir: Path) -> None:
+        sorted_reports = sorted(
+            self.vulnerability_reports, key=lambda x: (x["_sev_key"], x["timestamp"])
+        )
+
+        vuln_csv_file = run_dir / "vulnerabilities.csv"
+        with vuln_csv_file.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_VULN_CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(_vuln_csv_row(report) for report in sorted_reports)
+        self._vuln_csv_initialized = True
+
+        logger.info(f"Updated vulnerability index: {vuln_csv_file}")
+
     def _calculate_duration(self) -> float:
-        try:
-            start = datetime.fromisoformat(self.start_time.replace("Z", "+00:00"))
-            if self.end_time:
-                end = datetime.fromisoformat(self.end_time.replace("Z", "+00:00"))
-                return (end - start).total_seconds()
-        except (ValueError, TypeError):
-            pass
-        return 0.0
+        if self._end_dt is None:
+            return 0.0
+        return (self._end_dt - self._start_dt).total_seconds()
 
     def get_agent_tools(self, agent_id: str) -> list[dict[str, Any]]:
         return [
-            exec_data
-            for exec_data in self.tool_executions.values()
-            if exec_data.get("agent_id") == agent_id
+            self.tool_executions[execution_id]
+            for execution_id in self._tools_by_agent.get(agent_id, ())
         ]
 
     def get_real_tool_count(self) -> int:
-        return sum(
-            1
-            for exec_data in self.tool_executions.values()
-            if exec_data.get("tool_name") not in ["scan_start_info", "subagent_start_info"]
-        )
+        return self._real_tool_count
 
     def get_total_llm_stats(self) -> dict[str, Any]:
         from strix.tools.agents_graph.agents_graph_actions import _agent_instances
 
-        total_stats = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cached_tokens": 0,
-            "cache_creation_tokens": 0,
-            "cost": 0.0,
-            "requests": 0,
-            "failed_requests": 0,
-        }
-
-        for agent_instance in _agent_instances.values():
-            if hasattr(agent_instance, "llm") and hasattr(agent_instance.llm, "_total_stats"):
-                agent_stats = agent_instance.llm._total_stats
-                total_stats["input_tokens"] += agent_stats.input_tokens
-                total_stats["output_tokens"] += agent_stats.output_tokens
-                total_stats["cached_tokens"] += agent_stats.cached_tokens
-                total_stats["cache_creation_tokens"] += agent_stats.cache_creation_tokens
-                total_stats["cost"] += agent_stats.cost
-                total_stats["requests"] += agent_stats.requests
-                total_stats["failed_requests"] += agent_stats.failed_requests
+        agent_stats = [
+            _get_llm_stat_fields(agent_instance.llm._total_stats)
+            for agent_instance in _agent_instances.values()
+            if hasattr(agent_instance, "llm") and hasattr(agent_instance.llm, "_total_stats")
+        ]
+        # One attrgetter call per agent, then a C-level sum per column.
+        total_stats: dict[str, Any] = dict.fromkeys(_LLM_STAT_FIELDS, 0)
+        total_stats.update(
+            zip(_LLM_STAT_FIELDS, map(sum, zip(*agent_stats, strict=True)), strict=False)
+        )
 
-        total_stats["cost"] = round(total_stats["cost"], 4)
+        total_stats["cost"] = round(float(total_stats["cost"]), 4)
 
         return {
             "total": total_stats,
@@ -483,9 +676,13 @@ class Tracer:
 
     def cleanup(self) -> None:
         self.save_run_data(mark_complete=True)
-        if self._events_file:
-            try:
-                self._events_file.close()
-            except (OSError, IOError):
-                pass
-            self._events_file = None
+        self._stop_writer_thread()
+        self._flush_stop.set()
+        with self._events_lock:
+            self._flush_events_locked()
+            if self._events_file:
+                try:
+                    self._events_file.close()
+                except (OSError, IOError):
+                    pass
+                self._events_file = None
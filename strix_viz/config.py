@@ -17,16 +17,19 @@ def get_runs_dir() -> Path:
     return candidate.expanduser().resolve()
 
 
+@lru_cache(maxsize=256)
 def get_run_dir(run_id: str) -> Path:
     """Return the path to a specific run directory."""
     return get_runs_dir() / run_id
 
 
+@lru_cache(maxsize=256)
 def get_events_path(run_id: str) -> Path:
     """Return the path to the events log for a run."""
     return get_run_dir(run_id) / EVENTS_FILE_NAME
 
 
+@lru_cache(maxsize=1)
 def get_agent_runs_dir() -> Path:
     """Return the directory that holds agent runs (for vulnerabilities.csv)."""
     configured = os.environ.get("STRIX_RUNS_DIR")
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import aclosing
 from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, TypeAdapter
 
 from . import __version__
+from .models import RunMetadata
 from .run_loader import list_runs, load_events_page, load_snapshot, stream_new_events, load_vulnerabilities
 
 LOGGER = logging.getLogger(__name__)
@@ -24,37 +29,67 @@ app.add_middleware(
 )
 
 
+_RUN_LIST_ADAPTER = TypeAdapter(list[RunMetadata])
+_VULNERABILITY_LIST_ADAPTER = TypeAdapter(list[dict[str, Any]])
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Serialize a model straight to JSON bytes in pydantic-core, skipping the dict round-trip."""
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
 @app.get("/api/runs")
 def api_list_runs():
-    return [meta.model_dump() for meta in list_runs()]
+    return Response(_RUN_LIST_ADAPTER.dump_json(list_runs()), media_type="application/json")
 
 
 @app.get("/api/runs/{run_id}/snapshot")
 def api_snapshot(run_id: str):
-    snapshot = load_snapshot(run_id)
-    return snapshot.model_dump()
+    return _model_response(load_snapshot(run_id))
 
 
 @app.get("/api/runs/{run_id}/events")
 def api_events(run_id: str, offset: int = 0, limit: int = 200):
     limit = max(1, min(limit, 1000))
-    page = load_events_page(run_id, offset=offset, limit=limit)
-    return page.model_dump()
+    return _model_response(load_events_page(run_id, offset=offset, limit=limit))
 
 
 @app.get("/api/runs/{run_id}/vulnerabilities")
 def api_vulnerabilities(run_id: str):
     """Load vulnerabilities from agent_runs directory."""
     vulnerabilities = load_vulnerabilities(run_id)
-    return vulnerabilities
+    return Response(_VULNERABILITY_LIST_ADAPTER.dump_json(vulnerabilities), media_type="application/json")
+
+
+async def _forward_events(websocket: WebSocket, run_id: str) -> None:
+    async with aclosing(stream_new_events(run_id)) as events:
+        async for event in events:
+            await websocket.send_json(event)
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
 
 
 @app.websocket("/ws/runs/{run_id}")
 async def websocket_events(websocket: WebSocket, run_id: str) -> None:
     await websocket.accept()
     try:
-        async for event in stream_new_events(run_id):
-            await websocket.send_json(event)
+        # A quiet run never sends, so a disconnect would otherwise go unnoticed and keep the
+        # stream (and its file watch) alive indefinitely.
+        forward = asyncio.create_task(_forward_events(websocket, run_id))
+        disconnect = asyncio.create_task(_wait_for_disconnect(websocket))
+        try:
+            await asyncio.wait({forward, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            forward.cancel()
+            disconnect.cancel()
+            await asyncio.wait({forward, disconnect})
+        if forward.cancelled():
+            LOGGER.info("Websocket disconnected for run %s", run_id)
+        else:
+            forward.result()
     except WebSocketDisconnect:
         LOGGER.info("Websocket disconnected for run %s", run_id)
     except HTTPException as exc:  # bubble up missing runs to the client
@@ -10,19 +10,20 @@ from pydantic import BaseModel, Field
 
 class EventDict(TypedDict, total=False):
     ts: str
+    seq: int
     type: str
-    agent_id: str
-    target: str
-    action: str
-    tool: str
-    status: str
+    agent_id: Optional[str]
+    target: Optional[str]
+    action: Optional[str]
+    tool: Optional[str]
+    status: Optional[str]
     meta: Dict[str, Any]
     args: Dict[str, Any]
-    result_summary: str
-    vuln_id: str
-    severity: str
-    category: str
-    description: str
+    result_summary: Optional[str]
+    vuln_id: Optional[str]
+    severity: Optional[str]
+    category: Optional[str]
+    description: Optional[str]
 
 
 class RunMetadata(BaseModel):
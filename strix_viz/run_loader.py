@@ -5,23 +5,41 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from dataclasses import dataclass
+import os
+import threading
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple, TypeVar
 
 from fastapi import HTTPException, status
 
 from .config import EVENTS_FILE_NAME, get_events_path, get_run_dir, get_runs_dir, get_agent_runs_dir
-from .models import Agent, Asset, Edge, EventDict, PaginatedEvents, RunMetadata, Snapshot, ToolCall, Vulnerability
+from .models import EventDict, PaginatedEvents, RunMetadata, Snapshot
+from .snapshot_builder import SnapshotBuilder, TimedEvent
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - fall back to polling without watchfiles
+    awatch = None  # type: ignore[assignment]
 
 LOGGER = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 1 << 20
 
-@dataclass(slots=True)
-class ParsedEvent:
-    raw: EventDict
-    ts: datetime
+# Upper bound on runs kept in each per-run cache, in line with the path caches in config.
+RUN_CACHE_SIZE = 256
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # ---------------------------------------------------------------------------
@@ -31,37 +49,60 @@ class ParsedEvent:
 def parse_timestamp(raw: Optional[str]) -> datetime:
     if raw is None:
         return datetime.now(tz=timezone.utc)
-    candidate = raw.replace("Z", "+00:00")
     try:
-        parsed = datetime.fromisoformat(candidate)
+        return _parse_utc_timestamp(raw)
     except ValueError:
         LOGGER.warning("Invalid timestamp '%s', defaulting to now", raw)
         return datetime.now(tz=timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _parse_utc_timestamp(raw: str) -> datetime:
+    # fromisoformat accepts a trailing "Z" natively, and the tracer emits bursts of identical ts.
+    parsed = datetime.fromisoformat(raw)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=timezone.utc)
     return parsed.astimezone(timezone.utc)
 
 
-def read_events_file(path: Path) -> list[ParsedEvent]:
-    events: list[ParsedEvent] = []
-    if not path.exists():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="events.jsonl missing for run")
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                LOGGER.warning("Skipping malformed JSON line: %s", line)
-                continue
-            if not isinstance(payload, dict):
-                continue
-            payload.setdefault("type", "event")
-            ts = parse_timestamp(payload.get("ts"))
-            events.append(ParsedEvent(raw=payload, ts=ts))
-    return events
+def _decode_event_line(line: bytes) -> Optional[EventDict]:
+    if not line or line.isspace():
+        return None
+    try:
+        payload = _json_loads(line)
+    except json.JSONDecodeError:
+        LOGGER.warning("Skipping malformed JSON line: %s", line.strip())
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _parse_event(payload: EventDict) -> TimedEvent:
+    return parse_timestamp(payload.get("ts")), payload
+
+
+# ---------------------------------------------------------------------------
+# Per-run caches
+# ---------------------------------------------------------------------------
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def _cache_get(cache: OrderedDict[_K, _V], key: _K) -> Optional[_V]:
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict[_K, _V], key: _K, value: _V) -> None:
+    """Store ``value`` as the most recently used entry, evicting the oldest past RUN_CACHE_SIZE."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > RUN_CACHE_SIZE:
+        cache.popitem(last=False)
 
 
 # ---------------------------------------------------------------------------
@@ -73,218 +114,309 @@ def list_runs() -> list[RunMetadata]:
     if not runs_dir.exists():
         return []
     runs: list[RunMetadata] = []
-    for child in runs_dir.iterdir():
-        if not child.is_dir():
-            continue
-        events_path = child / EVENTS_FILE_NAME
-        if not events_path.exists():
-            continue
-        created_at = datetime.fromtimestamp(child.stat().st_mtime, tz=timezone.utc)
-        event_count = count_file_lines(events_path)
-        runs.append(RunMetadata(id=child.name, created_at=created_at, event_count=event_count))
+    with os.scandir(runs_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            events_path = Path(entry.path) / EVENTS_FILE_NAME
+            try:
+                events_stat = events_path.stat()
+            except FileNotFoundError:
+                continue
+            created_at = datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
+            event_count = _cached_event_count(events_path, events_stat)
+            runs.append(RunMetadata(id=entry.name, created_at=created_at, event_count=event_count))
     runs.sort(key=lambda meta: meta.created_at or datetime.fromtimestamp(0, tz=timezone.utc), reverse=True)
     return runs
 
 
+# Line counts keyed by events path, tagged with the (size, mtime_ns) they were computed at. Kept
+# in process rather than on disk: writing into a run dir would bump the mtime list_runs reports.
+_EVENT_COUNT_CACHE: OrderedDict[Path, Tuple[int, int, int]] = OrderedDict()
+_EVENT_COUNT_LOCK = threading.Lock()
+
+
+def _cached_event_count(events_path: Path, events_stat: os.stat_result) -> int:
+    """Return the line count of ``events_path``, recounting only after the file changes."""
+    size, mtime_ns = events_stat.st_size, events_stat.st_mtime_ns
+    with _EVENT_COUNT_LOCK:
+        cached = _cache_get(_EVENT_COUNT_CACHE, events_path)
+    if cached is not None and cached[0] == size and cached[1] == mtime_ns:
+        return cached[2]
+    count = count_file_lines(events_path)
+    with _EVENT_COUNT_LOCK:
+        _cache_put(_EVENT_COUNT_CACHE, events_path, (size, mtime_ns, count))
+    return count
+
+
 def count_file_lines(path: Path) -> int:
+    # mmap objects have no count(), so chunked reads are the simplest way to keep newline
+    # counting in C (bytes.count) with bounded memory.
     count = 0
-    with path.open("r", encoding="utf-8") as handle:
-        for _ in handle:
-            count += 1
-    return count
+    last_byte = b"\n"
+    with path.open("rb") as handle:
+        while chunk := handle.read1(READ_CHUNK_SIZE):
+            count += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    # An unterminated final line still counts, as it did with line iteration.
+    return count if last_byte == b"\n" else count + 1
+
+
+@dataclass(slots=True)
+class _SnapshotCacheEntry:
+    file_id: Tuple[int, int]
+    offset: int
+    builder: SnapshotBuilder
+    snapshot: Optional[Snapshot] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# events.jsonl is append-only, so each run keeps its builder and resumes from the last byte read.
+# The cache lock only guards the mapping; each entry's own lock serialises builds of that run, so
+# a slow first build does not hold up snapshots of other runs.
+_SNAPSHOT_CACHE: OrderedDict[str, _SnapshotCacheEntry] = OrderedDict()
+_SNAPSHOT_CACHE_LOCK = threading.Lock()
+
+
+def _stat_events_file(path: Path) -> os.stat_result:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="events.jsonl missing for run") from None
+
+
+def _scan_appended_lines(path: Path, offset: int, handle_line: Callable[[int, bytes], bool]) -> int:
+    """Pass each complete line after ``offset`` with its byte position; return the new offset."""
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        tail = b""
+        while chunk := handle.read1(READ_CHUNK_SIZE):
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                handle_line(offset, line)
+                offset += len(line) + 1
+    # A complete record may lack its newline; a half-written one fails to decode and is retried later.
+    if tail and handle_line(offset, tail):
+        offset += len(tail)
+    return offset
 
 
 def load_snapshot(run_id: str) -> Snapshot:
-    parsed_events = read_events_file(get_events_path(run_id))
-    builder = SnapshotBuilder(run_id)
-    for event in parsed_events:
-        builder.apply_event(event)
-    return builder.build()
+    path = get_events_path(run_id)
+    stat = _stat_events_file(path)
+    file_id = (stat.st_dev, stat.st_ino)
+    with _SNAPSHOT_CACHE_LOCK:
+        entry = _cache_get(_SNAPSHOT_CACHE, run_id)
+        if entry is None:
+            entry = _SnapshotCacheEntry(file_id=file_id, offset=0, builder=SnapshotBuilder(run_id))
+            _cache_put(_SNAPSHOT_CACHE, run_id, entry)
+    with entry.lock:
+        if entry.file_id != file_id or stat.st_size < entry.offset:
+            # The file was replaced or truncated, so start the run over.
+            entry.file_id = file_id
+            entry.offset = 0
+            entry.builder = SnapshotBuilder(run_id)
+            entry.snapshot = None
+        if entry.snapshot is None or stat.st_size != entry.offset:
+            entry.offset = _apply_appended_events(entry.builder, path, entry.offset)
+            entry.snapshot = entry.builder.build()
+        return entry.snapshot
+
+
+def _apply_appended_events(builder: SnapshotBuilder, path: Path, offset: int) -> int:
+    """Fold the events after ``offset`` into ``builder`` one read chunk at a time; return the new offset."""
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        tail = b""
+        while chunk := handle.read1(READ_CHUNK_SIZE):
+            data = tail + chunk
+            lines = data.split(b"\n")
+            tail = lines.pop()
+            offset += len(data) - len(tail)
+            builder.apply_events(
+                _parse_event(payload) for payload in map(_decode_event_line, lines) if payload is not None
+            )
+    # Same tail handling as _scan_appended_lines: only a decodable record is consumed.
+    if tail and _apply_event_line(builder, tail):
+        offset += len(tail)
+    return offset
+
+
+def _apply_event_line(builder: SnapshotBuilder, line: bytes) -> bool:
+    payload = _decode_event_line(line)
+    if payload is None:
+        return False
+    payload.setdefault("type", "event")
+    builder.apply_event(*_parse_event(payload))
+    return True
+
+
+@dataclass(slots=True)
+class _EventIndex:
+    file_id: Tuple[int, int]
+    offset: int
+    starts: list[int]
+
+
+# Byte position of every decodable event, so a page is one seek + read of just its window.
+_EVENT_INDEX_CACHE: OrderedDict[str, _EventIndex] = OrderedDict()
+_EVENT_INDEX_LOCK = threading.Lock()
+
+
+def _get_event_index(run_id: str, path: Path) -> Tuple[list[int], int, int]:
+    """Return ``(starts, count, end_offset)``; only ``starts[:count]`` belongs to this view.
+
+    Other requests keep appending to the shared ``starts`` list after the lock is released, so
+    the count and end offset are captured while it is held.
+    """
+    stat = _stat_events_file(path)
+    file_id = (stat.st_dev, stat.st_ino)
+    with _EVENT_INDEX_LOCK:
+        index = _cache_get(_EVENT_INDEX_CACHE, run_id)
+        if index is None or index.file_id != file_id or stat.st_size < index.offset:
+            index = _EventIndex(file_id=file_id, offset=0, starts=[])
+            _cache_put(_EVENT_INDEX_CACHE, run_id, index)
+        if stat.st_size != index.offset:
+            starts = index.starts
+
+            def index_line(position: int, line: bytes) -> bool:
+                if _decode_event_line(line) is None:
+                    return False
+                starts.append(position)
+                return True
+
+            index.offset = _scan_appended_lines(path, index.offset, index_line)
+        return index.starts, len(index.starts), index.offset
 
 
 def load_events_page(run_id: str, offset: int, limit: int) -> PaginatedEvents:
-    parsed_events = read_events_file(get_events_path(run_id))
-    total = len(parsed_events)
+    path = get_events_path(run_id)
+    starts, total, end_offset = _get_event_index(run_id, path)
     slice_start = max(offset, 0)
     slice_end = min(slice_start + limit, total)
-    raw_events: list[EventDict] = [parsed_events[idx].raw for idx in range(slice_start, slice_end)]
+    raw_events: list[EventDict] = []
+    if slice_start < slice_end:
+        window_end = starts[slice_end] if slice_end < total else end_offset
+        with path.open("rb") as handle:
+            handle.seek(starts[slice_start])
+            window = handle.read(window_end - starts[slice_start])
+        for line in window.split(b"\n"):
+            payload = _decode_event_line(line)
+            if payload is not None:
+                payload.setdefault("type", "event")
+                raw_events.append(payload)
     return PaginatedEvents(run_id=run_id, events=raw_events, offset=slice_start, limit=limit, total=total)
 
 
 # ---------------------------------------------------------------------------
-# Snapshot builder
+# Event streaming
 # ---------------------------------------------------------------------------
 
-class SnapshotBuilder:
-    def __init__(self, run_id: str) -> None:
-        self.run_id = run_id
-        self.agents: Dict[str, Dict[str, Any]] = {}
-        self.assets: Dict[str, Dict[str, Any]] = {}
-        self.vulns: Dict[str, Vulnerability] = {}
-        self.edges: Dict[Tuple[str, str, str], Edge] = {}
-        self.tool_calls: list[ToolCall] = []
-        self.last_event_ts: Optional[datetime] = None
-        self.tool_counter = 0
-
-    def apply_event(self, event: ParsedEvent) -> None:
-        self.last_event_ts = event.ts
-        payload = event.raw
-        event_type = payload.get("type", "event")
-        agent_id = payload.get("agent_id")
-        target = payload.get("target")
-        self._touch_agent(agent_id, event.ts)
-        if target:
-            self._touch_asset(target, event.ts)
-
-        if event_type == "agent_step":
-            self._handle_agent_step(agent_id, target, payload)
-        elif event_type == "vuln_found":
-            self._handle_vuln_found(agent_id, target, payload, event.ts)
-        elif event_type == "mcp_tool_call":
-            self._handle_tool_call(agent_id, target, payload, event.ts)
-        else:
-            # default handling: only maintain nodes
-            if agent_id and target:
-                self._add_edge(agent_id, target, relation=event_type, label=payload.get("action"))
-
-    def build(self) -> Snapshot:
-        agents = [
-            Agent(
-                id=agent_id,
-                label=data.get("label", agent_id),
-                first_seen=data["first_seen"],
-                last_seen=data["last_seen"],
-                meta=data.get("meta", {}),
-            )
-            for agent_id, data in self.agents.items()
-        ]
-        assets = [
-            Asset(
-                id=asset_id,
-                label=data.get("label", asset_id),
-                url=data.get("url", asset_id),
-                first_seen=data["first_seen"],
-                last_seen=data["last_seen"],
-                meta=data.get("meta", {}),
-            )
-            for asset_id, data in self.assets.items()
-        ]
-        vulns = list(self.vulns.values())
-        edges = list(self.edges.values())
-        return Snapshot(
-            run_id=self.run_id,
-            agents=sorted(agents, key=lambda agent: agent.id),
-            assets=sorted(assets, key=lambda asset: asset.id),
-            vulnerabilities=sorted(vulns, key=lambda vuln: vuln.ts),
-            edges=edges,
-            tool_calls=self.tool_calls,
-            last_event_ts=self.last_event_ts,
-        )
-
-    def _touch_agent(self, agent_id: Optional[str], ts: datetime) -> None:
-        if not agent_id:
-            return
-        agent = self.agents.setdefault(agent_id, {"id": agent_id, "label": agent_id, "first_seen": ts, "last_seen": ts, "meta": {}})
-        agent["first_seen"] = min(agent["first_seen"], ts)
-        agent["last_seen"] = max(agent["last_seen"], ts)
-
-    def _touch_asset(self, asset_id: Optional[str], ts: datetime) -> None:
-        if not asset_id:
-            return
-        asset = self.assets.setdefault(asset_id, {"id": asset_id, "label": asset_id, "url": asset_id, "first_seen": ts, "last_seen": ts, "meta": {}})
-        asset["first_seen"] = min(asset["first_seen"], ts)
-        asset["last_seen"] = max(asset["last_seen"], ts)
-
-    def _handle_agent_step(self, agent_id: Optional[str], target: Optional[str], payload: EventDict) -> None:
-        if agent_id and target:
-            relation = payload.get("action") or payload.get("tool") or "agent_step"
-            self._add_edge(agent_id, target, relation=relation, label=payload.get("status"))
-
-    def _handle_vuln_found(self, agent_id: Optional[str], target: Optional[str], payload: EventDict, ts: datetime) -> None:
-        vuln_id = payload.get("vuln_id") or f"vuln-{len(self.vulns) + 1}"
-        vuln = Vulnerability(
-            id=vuln_id,
-            agent_id=agent_id,
-            asset_id=target,
-            severity=payload.get("severity"),
-            category=payload.get("category"),
-            description=payload.get("description"),
-            ts=ts,
-        )
-        self.vulns[vuln_id] = vuln
-        if agent_id:
-            self._add_edge(agent_id, vuln_id, relation="reported", label=vuln.severity)
-        if target:
-            self._touch_asset(target, ts)
-            self._add_edge(vuln_id, target, relation="affects", label=vuln.category)
-
-    def _handle_tool_call(self, agent_id: Optional[str], target: Optional[str], payload: EventDict, ts: datetime) -> None:
-        self.tool_counter += 1
-        args = payload.get("args") or {}
-        inferred_target = target or _extract_tool_target(args)
-        if inferred_target:
-            self._touch_asset(inferred_target, ts)
-            if agent_id:
-                self._add_edge(agent_id, inferred_target, relation=payload.get("tool", "tool_call"), label=payload.get("status"))
-        tool_call = ToolCall(
-            id=f"tool-{self.tool_counter}",
-            ts=ts,
-            agent_id=agent_id,
-            tool=payload.get("tool"),
-            target=inferred_target,
-            status=payload.get("status"),
-            summary=payload.get("meta", {}).get("summary") if isinstance(payload.get("meta"), dict) else payload.get("result_summary"),
-            args=args if isinstance(args, dict) else {},
-            result_summary=payload.get("result_summary"),
-        )
-        self.tool_calls.append(tool_call)
-
-    def _add_edge(self, source: str, target: str, relation: str, label: Optional[str]) -> None:
-        key = (source, target, relation)
-        if key in self.edges:
-            return
-        edge = Edge(id=f"edge-{len(self.edges) + 1}", source=source, target=target, relation=relation, label=label)
-        self.edges[key] = edge
-
-
-def _extract_tool_target(args: Dict[str, Any]) -> Optional[str]:
-    url = args.get("url") if isinstance(args, dict) else None
-    if isinstance(url, str):
-        return url
-    target = args.get("target") if isinstance(args, dict) else None
-    if isinstance(target, str):
-        return target
-    return None
-
+STREAM_POLL_INTERVAL = 0.5
+
+
+class _RunWatcher:
+    """One filesystem watch per events file, shared by every stream tailing it.
+
+    ``awatch`` parks an anyio worker thread for as long as it runs, and those threads come from
+    the same limiter that serves the sync REST routes, so streams must not each own a watch.
+    """
+
+    def __init__(self, key: Tuple[asyncio.AbstractEventLoop, Path]) -> None:
+        self.key = key
+        self.path = key[1]
+        self.subscribers = 0
+        self.version = 0
+        self.failed = False
+        self._changed = asyncio.Condition()
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        # Watch only the run directory itself (the tracer writes e.g. vulnerabilities/ beneath it)
+        # and filter down to the events file, so writes to other files do not wake the stream.
+        file_name = self.path.name
+        try:
+            async for _changes in awatch(
+                self.path.parent,
+                watch_filter=lambda _change, changed: os.path.basename(changed) == file_name,
+                stop_event=self._stop,
+                recursive=False,
+            ):
+                await self._notify()
+        except Exception:  # pragma: no cover - e.g. the run dir vanished; subscribers fall back to polling
+            LOGGER.exception("Watching %s failed, falling back to polling", self.path)
+            self.failed = True
+            if _RUN_WATCHERS.get(self.key) is self:
+                del _RUN_WATCHERS[self.key]
+            await self._notify()
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+
+    async def wait(self, seen: int) -> int:
+        """Wait until the file changes after ``seen`` and return the new version."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.version != seen)
+            return self.version
+
+    def stop(self) -> None:
+        # The watch blocks a worker thread; stop_event ends it on the next step (~50 ms), whereas
+        # cancelling the task alone would keep the thread until awatch's 5 s rust timeout.
+        self._stop.set()
+
+
+# Keyed by event loop as well as path: a watcher's condition and task belong to one loop, and
+# each key is only ever touched from its own loop's thread, so no lock is needed.
+_RUN_WATCHERS: Dict[Tuple[asyncio.AbstractEventLoop, Path], _RunWatcher] = {}
+
+
+async def _watch_file(path: Path) -> AsyncIterator[None]:
+    """Yield once immediately, then whenever ``path`` may have grown."""
+    yield
+    if awatch is not None:
+        key = (asyncio.get_running_loop(), path)
+        watcher = _RUN_WATCHERS.get(key)
+        if watcher is None:
+            watcher = _RUN_WATCHERS[key] = _RunWatcher(key)
+        watcher.subscribers += 1
+        try:
+            seen = watcher.version
+            while not watcher.failed:
+                seen = await watcher.wait(seen)
+                yield
+        finally:
+            watcher.subscribers -= 1
+            if watcher.subscribers == 0:
+                if _RUN_WATCHERS.get(key) is watcher:
+                    del _RUN_WATCHERS[key]
+                watcher.stop()
+    while True:
+        await asyncio.sleep(STREAM_POLL_INTERVAL)
+        yield
 
-# ---------------------------------------------------------------------------
-# Event streaming
-# ---------------------------------------------------------------------------
 
 async def stream_new_events(run_id: str, start_at_end: bool = True) -> AsyncIterator[EventDict]:
     path = get_events_path(run_id)
     if not path.exists():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Run not found")
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         if start_at_end:
             handle.seek(0, 2)
-        while True:
-            position = handle.tell()
-            line = handle.readline()
-            if not line:
-                await asyncio.sleep(0.5)
-                handle.seek(position)
-                continue
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                LOGGER.warning("Skipping malformed JSON during stream: %s", line)
-                continue
-            if isinstance(payload, dict):
-                yield payload
+        pending = b""
+        async with aclosing(_watch_file(path)) as changes:
+            async for _ in changes:
+                while chunk := handle.read1(READ_CHUNK_SIZE):
+                    lines = (pending + chunk).split(b"\n")
+                    # Keep a trailing partial line until the writer finishes it.
+                    pending = lines.pop()
+                    for line in lines:
+                        payload = _decode_event_line(line)
+                        if payload is not None:
+                            yield payload
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,293 @@
+"""Incremental builder that folds run events into a viz snapshot.
+
+Kept free of I/O and fully annotated so it can be compiled with mypyc; the pure-Python
+module is used whenever no compiled extension is present.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .models import Agent, Asset, Edge, EventDict, Snapshot, ToolCall, Vulnerability
+
+# Relation names the builder emits itself; interned so edge keys compare by identity.
+_RELATION_AGENT_STEP = sys.intern("agent_step")
+_RELATION_TOOL_CALL = sys.intern("tool_call")
+_RELATION_REPORTED = sys.intern("reported")
+_RELATION_AFFECTS = sys.intern("affects")
+
+# C-level sort keys for build().
+_BY_KEY = itemgetter(0)
+_BY_TS = attrgetter("ts")
+
+
+# Only for small, bounded vocabularies (agent ids, event types, relations): interned strings are
+# immortal on 3.12+, so open-ended values such as targets must not go through here.
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# A decoded event paired with its parsed timestamp.
+TimedEvent = Tuple[datetime, EventDict]
+_EventHandler = Callable[[Optional[str], Optional[str], EventDict, datetime], None]
+
+
+@dataclass(slots=True)
+class _NodeState:
+    first_seen: datetime
+    last_seen: datetime
+    label: str
+    meta: Dict[str, Any]
+    url: Optional[str] = None
+
+
+class SnapshotBuilder:
+    def __init__(self, run_id: str) -> None:
+        self.run_id: str = run_id
+        self.agents: Dict[str, _NodeState] = {}
+        self.assets: Dict[str, _NodeState] = {}
+        # Edges, vulnerabilities and tool calls are kept as parallel columns and only turned
+        # into pydantic models in build().
+        self._edge_keys: set[Tuple[str, str, str]] = set()
+        self._edge_sources: list[str] = []
+        self._edge_targets: list[str] = []
+        self._edge_relations: list[str] = []
+        self._edge_labels: list[Optional[str]] = []
+        self._vuln_rows: Dict[str, int] = {}
+        self._vuln_ids: list[str] = []
+        self._vuln_agent_ids: list[Optional[str]] = []
+        self._vuln_asset_ids: list[Optional[str]] = []
+        self._vuln_severities: list[Optional[str]] = []
+        self._vuln_categories: list[Optional[str]] = []
+        self._vuln_descriptions: list[Optional[str]] = []
+        self._vuln_ts: list[datetime] = []
+        self._tool_ts: list[datetime] = []
+        self._tool_agent_ids: list[Optional[str]] = []
+        self._tool_names: list[Optional[str]] = []
+        self._tool_targets: list[Optional[str]] = []
+        self._tool_statuses: list[Optional[str]] = []
+        self._tool_summaries: list[Optional[str]] = []
+        self._tool_args: list[Dict[str, Any]] = []
+        self._tool_result_summaries: list[Optional[str]] = []
+        self.last_event_ts: Optional[datetime] = None
+        self.tool_counter: int = 0
+        self._dispatch: Dict[str, _EventHandler] = {
+            "agent_step": self._handle_agent_step,
+            "vuln_found": self._handle_vuln_found,
+            "mcp_tool_call": self._handle_tool_call,
+        }
+
+    def apply_event(self, ts: datetime, payload: EventDict) -> None:
+        self.last_event_ts = ts
+        event_type = _intern(payload.get("type", "event"))
+        agent_id = _intern(payload.get("agent_id"))
+        target = payload.get("target")
+        self._touch_agent(agent_id, ts)
+        if target:
+            self._touch_asset(target, ts)
+
+        handler = self._dispatch.get(event_type)
+        if handler is not None:
+            handler(agent_id, target, payload, ts)
+        elif agent_id and target:
+            # default handling: only maintain nodes
+            self._add_edge(agent_id, target, relation=event_type, label=payload.get("action"))
+
+    def apply_events(self, events: Iterable[TimedEvent]) -> None:
+        apply_event = self.apply_event
+        for ts, payload in events:
+            apply_event(ts, payload)
+
+    def build(self) -> Snapshot:
+        # Every field below was produced by the builder itself, so the models skip validation.
+        agents = [
+            Agent.model_construct(
+                id=agent_id,
+                label=state.label,
+                first_seen=state.first_seen,
+                last_seen=state.last_seen,
+                meta=state.meta,
+            )
+            for agent_id, state in sorted(self.agents.items(), key=_BY_KEY)
+        ]
+        assets = [
+            Asset.model_construct(
+                id=asset_id,
+                label=state.label,
+                url=state.url,
+                first_seen=state.first_seen,
+                last_seen=state.last_seen,
+                meta=state.meta,
+            )
+            for asset_id, state in sorted(self.assets.items(), key=_BY_KEY)
+        ]
+        vulns = [
+            Vulnerability.model_construct(
+                id=vuln_id,
+                agent_id=agent_id,
+                asset_id=asset_id,
+                severity=severity,
+                category=category,
+                description=description,
+                ts=ts,
+            )
+            for vuln_id, agent_id, asset_id, severity, category, description, ts in zip(
+                self._vuln_ids,
+                self._vuln_agent_ids,
+                self._vuln_asset_ids,
+                self._vuln_severities,
+                self._vuln_categories,
+                self._vuln_descriptions,
+                self._vuln_ts,
+                strict=True,
+            )
+        ]
+        edges = [
+            Edge.model_construct(id=f"edge-{idx}", source=source, target=target, relation=relation, label=label)
+            for idx, (source, target, relation, label) in enumerate(
+                zip(self._edge_sources, self._edge_targets, self._edge_relations, self._edge_labels, strict=True),
+                start=1,
+            )
+        ]
+        tool_calls = [
+            ToolCall.model_construct(
+                id=f"tool-{idx}",
+                ts=ts,
+                agent_id=agent_id,
+                tool=tool,
+                target=target,
+                status=tool_status,
+                summary=summary,
+                args=args,
+                result_summary=result_summary,
+            )
+            for idx, (ts, agent_id, tool, target, tool_status, summary, args, result_summary) in enumerate(
+                zip(
+                    self._tool_ts,
+                    self._tool_agent_ids,
+                    self._tool_names,
+                    self._tool_targets,
+                    self._tool_statuses,
+                    self._tool_summaries,
+                    self._tool_args,
+                    self._tool_result_summaries,
+                    strict=True,
+                ),
+                start=1,
+            )
+        ]
+        return Snapshot.model_construct(
+            run_id=self.run_id,
+            agents=agents,
+            assets=assets,
+            vulnerabilities=sorted(vulns, key=_BY_TS),
+            edges=edges,
+            tool_calls=tool_calls,
+            last_event_ts=self.last_event_ts,
+        )
+
+    def _touch_agent(self, agent_id: Optional[str], ts: datetime) -> None:
+        if not agent_id:
+            return
+        try:
+            state = self.agents[agent_id]
+        except KeyError:
+            self.agents[agent_id] = _NodeState(ts, ts, agent_id, {})
+            return
+        if ts < state.first_seen:
+            state.first_seen = ts
+        elif ts > state.last_seen:
+            state.last_seen = ts
+
+    def _touch_asset(self, asset_id: Optional[str], ts: datetime) -> None:
+        if not asset_id:
+            return
+        try:
+            state = self.assets[asset_id]
+        except KeyError:
+            self.assets[asset_id] = _NodeState(ts, ts, asset_id, {}, url=asset_id)
+            return
+        if ts < state.first_seen:
+            state.first_seen = ts
+        elif ts > state.last_seen:
+            state.last_seen = ts
+
+    def _handle_agent_step(self, agent_id: Optional[str], target: Optional[str], payload: EventDict, ts: datetime) -> None:
+        if agent_id and target:
+            relation = payload.get("action") or payload.get("tool") or _RELATION_AGENT_STEP
+            self._add_edge(agent_id, target, relation=relation, label=payload.get("status"))
+
+    def _handle_vuln_found(self, agent_id: Optional[str], target: Optional[str], payload: EventDict, ts: datetime) -> None:
+        vuln_id = payload.get("vuln_id") or f"vuln-{len(self._vuln_ids) + 1}"
+        severity = payload.get("severity")
+        category = payload.get("category")
+        description = payload.get("description")
+        row = self._vuln_rows.get(vuln_id)
+        if row is None:
+            self._vuln_rows[vuln_id] = len(self._vuln_ids)
+            self._vuln_ids.append(vuln_id)
+            self._vuln_agent_ids.append(agent_id)
+            self._vuln_asset_ids.append(target)
+            self._vuln_severities.append(severity)
+            self._vuln_categories.append(category)
+            self._vuln_descriptions.append(description)
+            self._vuln_ts.append(ts)
+        else:
+            # A repeated vuln_id replaces the earlier report in place.
+            self._vuln_agent_ids[row] = agent_id
+            self._vuln_asset_ids[row] = target
+            self._vuln_severities[row] = severity
+            self._vuln_categories[row] = category
+            self._vuln_descriptions[row] = description
+            self._vuln_ts[row] = ts
+        if agent_id:
+            self._add_edge(agent_id, vuln_id, relation=_RELATION_REPORTED, label=severity)
+        if target:
+            # apply_event has already touched the target asset.
+            self._add_edge(vuln_id, target, relation=_RELATION_AFFECTS, label=category)
+
+    def _handle_tool_call(self, agent_id: Optional[str], target: Optional[str], payload: EventDict, ts: datetime) -> None:
+        self.tool_counter += 1
+        args = payload.get("args") or {}
+        tool_status = payload.get("status")
+        result_summary = payload.get("result_summary")
+        meta = payload.get("meta")
+        summary = meta.get("summary") if isinstance(meta, dict) else result_summary
+        inferred_target = target or _extract_tool_target(args)
+        if inferred_target:
+            self._touch_asset(inferred_target, ts)
+            if agent_id:
+                self._add_edge(agent_id, inferred_target, relation=payload.get("tool", _RELATION_TOOL_CALL), label=tool_status)
+        self._tool_ts.append(ts)
+        self._tool_agent_ids.append(agent_id)
+        self._tool_names.append(payload.get("tool"))
+        self._tool_targets.append(inferred_target)
+        self._tool_statuses.append(tool_status)
+        self._tool_summaries.append(summary)
+        self._tool_args.append(args if isinstance(args, dict) else {})
+        self._tool_result_summaries.append(result_summary)
+
+    def _add_edge(self, source: str, target: str, relation: str, label: Optional[str]) -> None:
+        relation = _intern(relation)
+        key = (source, target, relation)
+        if key in self._edge_keys:
+            return
+        self._edge_keys.add(key)
+        self._edge_sources.append(source)
+        self._edge_targets.append(target)
+        self._edge_relations.append(relation)
+        self._edge_labels.append(label)
+
+
+def _extract_tool_target(args: Dict[str, Any]) -> Optional[str]:
+    url = args.get("url") if isinstance(args, dict) else None
+    if isinstance(url, str):
+        return url
+    target = args.get("target") if isinstance(args, dict) else None
+    if isinstance(target, str):
+        return target
+    return None